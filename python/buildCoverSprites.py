@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Script pour regrouper les couvertures des issues de chaque période en
+sprite sheets au format miniature, afin que les pages de listing ne
+chargent qu'une ou deux images au lieu d'une image par IssueCard.
+
+Pour chaque période, le script écrit dans public/images/<period>/sprites/<mode> :
+- les planches <groupe>_<empreinte>.webp
+- un fichier index.json donnant, pour chaque issue, la planche et la
+  position (x, y, largeur, hauteur) de sa miniature
+
+Les planches sont découpées par série : ajouter une issue ne modifie que
+la planche de sa série. Le nom de chaque planche contient l'empreinte de
+ses images et des couvertures réellement collées, pour qu'une copie en
+cache ne soit jamais servie avec un index plus récent. Une planche n'est régénérée que si l'une de ses
+images a changé, ou si une couverture n'a pas pu être lue la fois
+précédente ; les couvertures illisibles n'apparaissent pas dans l'index.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+
+if os.name == 'nt':
+    base_path = r'C:/Users/Yanis Hlali/code/ct/public/images'
+else:
+    base_path = r'./public/images'
+
+periods = ['marvel_now', 'all_new_all_different', 'ultimate_universe']
+
+# Dimensions des miniatures, identiques à celles d'IssueCard
+THUMB_WIDTH = 140
+THUMB_HEIGHT = 210
+SHEET_COLUMNS = 10
+COVERS_PER_SHEET = 100
+WEBP_QUALITY = 80
+# En mode period, une planche se termine en moyenne toutes les N séries
+SERIES_PER_SHEET = 8
+
+SERIE_PATTERN = re.compile(r'^(.+)_\d+(?:\.\d+)?$')
+
+
+def get_serie_prefix(issue_id):
+    """Même logique que getSeriePrefix dans src/utils/series.ts."""
+    match = SERIE_PATTERN.match(issue_id)
+    return match.group(1) if match else issue_id
+
+
+def list_covers(issues_dir):
+    """Renvoie les couvertures .webp d'un dossier, triées par issue_id."""
+    return sorted(
+        (path.stem, path) for path in issues_dir.iterdir()
+        if path.is_file() and path.suffix == '.webp'
+    )
+
+
+def group_by_serie(covers):
+    """Regroupe les couvertures par série, dans l'ordre des issue_ids."""
+    series = {}
+    for issue_id, path in covers:
+        series.setdefault(get_serie_prefix(issue_id), []).append((issue_id, path))
+    return sorted(series.items())
+
+
+def plan_sheets(covers, mode, per_sheet):
+    """
+    Découpe les couvertures en planches d'au plus per_sheet couvertures.
+    En mode series, chaque série a ses propres planches. En mode period,
+    les séries entières sont regroupées ; une planche se termine après une
+    série dont l'empreinte du nom le désigne (ou quand elle est pleine),
+    pour qu'ajouter une série ne décale pas les planches suivantes.
+    """
+    chunks = []
+    for serie, serie_covers in group_by_serie(covers):
+        for start in range(0, len(serie_covers), per_sheet):
+            chunks.append((serie, serie_covers[start:start + per_sheet]))
+
+    if mode == 'series':
+        return chunks
+
+    sheets = []
+    closed = True
+    for serie, chunk in chunks:
+        if not closed and len(sheets[-1][1]) + len(chunk) <= per_sheet:
+            sheets[-1][1].extend(chunk)
+        else:
+            sheets.append((serie, list(chunk)))
+        closed = is_sheet_boundary(serie)
+    return sheets
+
+
+def is_sheet_boundary(serie):
+    """Indique, de façon stable, si une planche se termine après cette série."""
+    digest = hashlib.sha1(serie.encode()).digest()
+    return int.from_bytes(digest[:4], 'big') % SERIES_PER_SHEET == 0
+
+
+def fingerprint(covers):
+    """Empreinte d'une planche, basée sur ses membres et leur date de modification."""
+    digest = hashlib.sha1(f"{THUMB_WIDTH}x{THUMB_HEIGHT}:{SHEET_COLUMNS}".encode())
+    for issue_id, path in covers:
+        stat = path.stat()
+        digest.update(f"{issue_id}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def sheet_file_name(group_name, sheet_fingerprint, pasted):
+    """Nom d'une planche, dérivé de son empreinte et des issue_ids collés."""
+    digest = hashlib.sha1(f"{sheet_fingerprint}:{','.join(pasted)}".encode())
+    return f"{group_name}_{digest.hexdigest()[:12]}.webp"
+
+
+def cover_offset(position):
+    """Position (x, y) de la n-ième miniature dans une planche."""
+    row, column = divmod(position, SHEET_COLUMNS)
+    return column * THUMB_WIDTH, row * THUMB_HEIGHT
+
+
+def build_sheet(sprites_dir, group_name, sheet_fingerprint, covers):
+    """
+    Génère une planche : redimensionne et colle chaque couverture.
+    Renvoie le nom du fichier écrit et les issue_ids effectivement collés.
+    """
+    columns = min(len(covers), SHEET_COLUMNS)
+    rows = (len(covers) + SHEET_COLUMNS - 1) // SHEET_COLUMNS
+    sheet = Image.new('RGB', (columns * THUMB_WIDTH, rows * THUMB_HEIGHT), (17, 24, 39))
+
+    pasted = []
+    for position, (issue_id, path) in enumerate(covers):
+        try:
+            with Image.open(path) as img:
+                thumb = ImageOps.fit(img.convert('RGB'), (THUMB_WIDTH, THUMB_HEIGHT), Image.LANCZOS)
+            sheet.paste(thumb, cover_offset(position))
+            pasted.append(issue_id)
+        except Exception as e:
+            print(f"Erreur lors du traitement de {path} : {e}")
+
+    sheet_file = sheet_file_name(group_name, sheet_fingerprint, pasted)
+    tmp_path = sprites_dir / f"{group_name}_{sheet_fingerprint[:12]}.tmp"
+    sheet.save(tmp_path, 'webp', quality=WEBP_QUALITY, method=6)
+    os.replace(tmp_path, sprites_dir / sheet_file)
+    return sheet_file, pasted
+
+
+def load_manifest(manifest_path):
+    """Charge le fichier d'offsets existant, pour ne reconstruire que le nécessaire."""
+    if not manifest_path.exists():
+        return {}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        print(f"⚠️  Fichier illisible, reconstruction complète : {manifest_path}")
+        return {}
+
+
+def build_period_sprites(period, mode, per_sheet, executor):
+    """Construit les planches et le fichier d'offsets d'une période."""
+    issues_dir = Path(base_path) / period / 'issues'
+    if not issues_dir.exists():
+        print(f"Dossier non trouvé : {issues_dir}")
+        return
+
+    sprites_dir = Path(base_path) / period / 'sprites' / mode
+    sprites_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = sprites_dir / 'index.json'
+
+    # Seules les planches complètes sont réutilisées, les autres sont retentées
+    previous = {
+        sheet['file'] for sheet in load_manifest(manifest_path).get('sheets', [])
+        if sheet.get('complete')
+    }
+
+    sheets = []
+    pending = []
+    for group_name, covers in plan_sheets(list_covers(issues_dir), mode, per_sheet):
+        sheet_fingerprint = fingerprint(covers)
+        issue_ids = [issue_id for issue_id, _ in covers]
+        sheet_file = sheet_file_name(group_name, sheet_fingerprint, issue_ids)
+        sheet = {'file': sheet_file, 'covers': covers, 'issue_ids': issue_ids}
+        if sheet_file not in previous or not (sprites_dir / sheet_file).exists():
+            sheet['future'] = executor.submit(
+                build_sheet, sprites_dir, group_name, sheet_fingerprint, covers
+            )
+            pending.append(sheet)
+        sheets.append(sheet)
+
+    for sheet in pending:
+        sheet['file'], sheet['issue_ids'] = sheet.pop('future').result()
+        print(f"{sheet['file']} généré pour {period}")
+
+    current = {sheet['file'] for sheet in sheets}
+    for stale in [*sprites_dir.glob('*.webp'), *sprites_dir.glob('*.tmp')]:
+        if stale.name not in current:
+            stale.unlink()
+            print(f"{stale.name} supprimé pour {period}")
+
+    manifest = {
+        'thumb_width': THUMB_WIDTH,
+        'thumb_height': THUMB_HEIGHT,
+        'sheets': [
+            {
+                'file': sheet['file'],
+                'complete': len(sheet['issue_ids']) == len(sheet['covers']),
+                'issue_ids': sheet['issue_ids'],
+            }
+            for sheet in sheets
+        ],
+        'issues': {},
+    }
+    for sheet in sheets:
+        pasted = set(sheet['issue_ids'])
+        for position, (issue_id, _) in enumerate(sheet['covers']):
+            if issue_id not in pasted:
+                continue
+            x, y = cover_offset(position)
+            manifest['issues'][issue_id] = {
+                'sheet': sheet['file'],
+                'x': x,
+                'y': y,
+                'width': THUMB_WIDTH,
+                'height': THUMB_HEIGHT,
+            }
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=4, ensure_ascii=False)
+
+    print(f"{manifest_path} : {len(manifest['issues'])} couvertures, "
+          f"{len(pending)}/{len(sheets)} planche(s) régénérée(s)")
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Génère les sprite sheets des couvertures.")
+    parser.add_argument("--group-by", choices=["period", "series"], default="period",
+                        help="Planches partagées par les séries de la période, ou une par série")
+    parser.add_argument("--per-sheet", type=int, default=COVERS_PER_SHEET,
+                        help="Nombre maximum de couvertures par planche")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus")
+    args = parser.parse_args()
+
+    if args.per_sheet < 1:
+        print(f"❌ Erreur : --per-sheet doit être au moins 1 (reçu {args.per_sheet})")
+        return
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for period in periods:
+            build_period_sprites(period, args.group_by, args.per_sheet, executor)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Script pour exporter le catalogue (issues, éditions françaises, events)
+au format colonnaire Parquet ou Arrow, pour les requêtes d'analyse
+(voir queryCatalogue.py).
+
+Tables produites dans le dossier de sortie :
+- issues : une ligne par issue, writers/pencillers en listes
+- edition_issues : liens édition française <-> issue
+- event_issues : liens event <-> issue (avec le type de catégorie)
+
+Les colonnes d'identifiants sont encodées en dictionnaire.
+
+Dépendance : pyarrow (pip install pyarrow).
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+
+TABLE_NAMES = ("issues", "edition_issues", "event_issues")
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+ISSUES_SCHEMA = pa.schema([
+    ("issue_id", DICT_STRING),
+    ("period_id", DICT_STRING),
+    ("order", pa.int32()),
+    ("title", pa.string()),
+    ("writers", pa.list_(DICT_STRING)),
+    ("pencillers", pa.list_(DICT_STRING)),
+])
+
+EDITION_ISSUES_SCHEMA = pa.schema([
+    ("edition_id", DICT_STRING),
+    ("issue_id", DICT_STRING),
+    ("period_id", DICT_STRING),
+])
+
+EVENT_ISSUES_SCHEMA = pa.schema([
+    ("event_id", DICT_STRING),
+    ("issue_id", DICT_STRING),
+    ("period_id", DICT_STRING),
+    ("category_type", DICT_STRING),
+])
+
+
+def load_json_list(file_path):
+    """Charge un fichier JSON contenant une liste, ou renvoie une liste vide."""
+    if not file_path.exists():
+        return []
+
+    try:
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
+            data = json.load(f)
+    except json.JSONDecodeError:
+        print(f"❌ Erreur : Impossible de décoder le fichier JSON - {file_path}")
+        return []
+
+    if not isinstance(data, list):
+        print(f"⚠️  Format inattendu dans {file_path}, ignoré.")
+        return []
+
+    return data
+
+
+def event_issue_links(event):
+    """
+    Renvoie les couples (issue_id, type de catégorie) d'un event,
+    qu'il liste ses issues directement ou via ses catégories.
+    """
+    if 'issue_ids' in event:
+        return [(issue_id, None) for issue_id in event['issue_ids']]
+
+    links = []
+    for category in event.get('categories', []):
+        category_type = category.get('type', 'tie-in')
+        links.extend((issue_id, category_type) for issue_id in category.get('issue_ids', []))
+    return links
+
+
+def collect_catalogue(data_dir):
+    """Parcourt les périodes de data_dir et regroupe les données en colonnes."""
+    issues = {name: [] for name in ISSUES_SCHEMA.names}
+    edition_issues = {name: [] for name in EDITION_ISSUES_SCHEMA.names}
+    event_issues = {name: [] for name in EVENT_ISSUES_SCHEMA.names}
+
+    for period_dir in sorted(Path(data_dir).iterdir()):
+        if not period_dir.is_dir():
+            continue
+        period_id = period_dir.name
+
+        for issue in load_json_list(period_dir / "issues.json"):
+            if 'id' not in issue:
+                continue
+            issues["issue_id"].append(issue['id'])
+            issues["period_id"].append(issue.get('period_id', period_id))
+            issues["order"].append(issue.get('order'))
+            issues["title"].append(issue.get('title', ''))
+            issues["writers"].append(issue.get('writers', []))
+            issues["pencillers"].append(issue.get('pencillers', []))
+
+        for edition in load_json_list(period_dir / "french_editions.json"):
+            if 'id' not in edition:
+                continue
+            for issue_id in edition.get('issue_ids', []):
+                edition_issues["edition_id"].append(edition['id'])
+                edition_issues["issue_id"].append(issue_id)
+                edition_issues["period_id"].append(period_id)
+
+        for event in load_json_list(period_dir / "events.json"):
+            if 'id' not in event:
+                continue
+            for issue_id, category_type in event_issue_links(event):
+                event_issues["event_id"].append(event['id'])
+                event_issues["issue_id"].append(issue_id)
+                event_issues["period_id"].append(event.get('period_id', period_id))
+                event_issues["category_type"].append(category_type)
+
+    return {
+        "issues": build_table(issues, ISSUES_SCHEMA),
+        "edition_issues": build_table(edition_issues, EDITION_ISSUES_SCHEMA),
+        "event_issues": build_table(event_issues, EVENT_ISSUES_SCHEMA),
+    }
+
+
+def build_table(columns, schema):
+    """Construit une table Arrow, en encodant en dictionnaire les colonnes concernées."""
+    arrays = []
+    for field in schema:
+        values = columns[field.name]
+        if pa.types.is_list(field.type):
+            arrays.append(build_list_array(values))
+        elif pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def build_list_array(values):
+    """Construit une colonne liste dont les éléments sont encodés en dictionnaire."""
+    offsets = [0]
+    flat = []
+    for items in values:
+        flat.extend(items or [])
+        offsets.append(len(flat))
+    flat_array = pa.array(flat, type=pa.string()).dictionary_encode()
+    return pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), flat_array)
+
+
+def write_catalogue(tables, output_dir, fmt="parquet"):
+    """Écrit chaque table dans output_dir au format demandé."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for name in TABLE_NAMES:
+        file_path = output_dir / f"{name}{FORMATS[fmt]}"
+        if fmt == "parquet":
+            pq.write_table(tables[name], file_path, compression="zstd")
+        else:
+            feather.write_feather(tables[name], file_path, compression="zstd")
+        print(f"💾 {file_path} : {tables[name].num_rows} lignes")
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Exporte le catalogue au format colonnaire.")
+    parser.add_argument("--data-dir", default="./data", help="Dossier des données JSON")
+    parser.add_argument("--output", default="./export", help="Dossier de sortie")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="parquet", help="Format des fichiers")
+    args = parser.parse_args()
+
+    if not Path(args.data_dir).is_dir():
+        print(f"❌ Erreur : Dossier non trouvé - {args.data_dir}")
+        return
+
+    print(f"📚 Chargement du catalogue depuis {args.data_dir}...")
+    tables = collect_catalogue(args.data_dir)
+    write_catalogue(tables, args.output, args.format)
+    print("🎉 Export terminé!")
+
+
+if __name__ == "__main__":
+    main()
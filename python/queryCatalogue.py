@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Requêtes d'analyse sur le catalogue exporté par exportCatalogue.py.
+
+Les statistiques (couverture des traductions, auteurs les plus
+traduits ou non traduits par période, etc.) sont calculées par des
+group-by vectorisés sur les tables Arrow, sans boucle Python par issue.
+
+Dépendance : pyarrow (pip install pyarrow).
+"""
+
+import argparse
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from exportCatalogue import FORMATS, TABLE_NAMES
+
+
+CREATOR_ROLES = ("writers", "pencillers")
+
+
+def as_strings(column):
+    """Décode une colonne encodée en dictionnaire en simple colonne de chaînes."""
+    return pc.cast(column, pa.string())
+
+
+def decode_keys(table, keys):
+    """Décode les clés de regroupement pour pouvoir trier le résultat."""
+    for key in keys:
+        index = table.schema.get_field_index(key)
+        if pa.types.is_dictionary(table.schema.field(index).type):
+            table = table.set_column(index, key, as_strings(table[key]))
+    return table
+
+
+def aggregate_coverage(table, keys):
+    """
+    Compte les issues et les issues traduites par groupe de `keys`, puis
+    ajoute les colonnes untranslated et coverage. Les colonnes sont
+    sélectionnées par nom, l'ordre de sortie d'aggregate dépendant de la
+    version de pyarrow.
+    """
+    result = table.group_by(keys).aggregate([
+        ("issue_id", "count"),
+        ("translated", "sum"),
+    ])
+    result = result.select(keys + ["issue_id_count", "translated_sum"])
+    result = decode_keys(result.rename_columns(keys + ["issues", "translated"]), keys)
+
+    total = result["issues"]
+    translated = result["translated"]
+    result = result.append_column("untranslated", pc.subtract(total, translated))
+    return result.append_column("coverage", pc.divide(pc.cast(translated, pa.float64()), total))
+
+
+class CatalogueQuery:
+    """API de requêtes sur les tables issues, edition_issues et event_issues."""
+
+    def __init__(self, issues, edition_issues, event_issues):
+        self.edition_issues = edition_issues
+        self.event_issues = event_issues
+
+        translated_ids = pc.unique(as_strings(edition_issues["issue_id"]))
+        translated = pc.is_in(as_strings(issues["issue_id"]), value_set=translated_ids)
+        self.issues = issues.append_column("translated", pc.cast(translated, pa.int64()))
+        self._translated_ids = translated_ids
+
+    @classmethod
+    def load(cls, export_dir, fmt="parquet"):
+        """Charge les tables écrites par exportCatalogue.py."""
+        export_dir = Path(export_dir)
+        tables = {}
+        for name in TABLE_NAMES:
+            file_path = export_dir / f"{name}{FORMATS[fmt]}"
+            if fmt == "parquet":
+                tables[name] = pq.read_table(file_path)
+            else:
+                tables[name] = feather.read_table(file_path)
+        return cls(**tables)
+
+    def coverage(self, by="period_id"):
+        """Nombre d'issues, d'issues traduites et taux de couverture, groupés par `by`."""
+        keys = [by] if isinstance(by, str) else list(by)
+        result = aggregate_coverage(self.issues, keys)
+        return result.sort_by([(key, "ascending") for key in keys])
+
+    def creator_issues(self, role="writers"):
+        """Table éclatée : une ligne par couple (créateur, issue)."""
+        if role not in CREATOR_ROLES:
+            raise ValueError(f"Rôle inconnu : {role} (attendu : {', '.join(CREATOR_ROLES)})")
+
+        creators = self.issues[role].combine_chunks()
+        parents = pc.list_parent_indices(creators)
+        exploded = self.issues.select(["issue_id", "period_id", "translated"]).take(parents)
+        return exploded.append_column("creator", pc.list_flatten(creators))
+
+    def creator_stats(self, role="writers", by="period_id", untranslated_only=False):
+        """
+        Statistiques par créateur (et par `by` si fourni), triées par
+        nombre d'issues non traduites décroissant.
+        """
+        keys = ["creator"] + ([by] if by else [])
+        result = aggregate_coverage(self.creator_issues(role), keys)
+
+        if untranslated_only:
+            result = result.filter(pc.greater(result["untranslated"], 0))
+        return result.sort_by([("untranslated", "descending"), ("issues", "descending")])
+
+    def event_coverage(self, category_type=None):
+        """Couverture des traductions par event, éventuellement limitée à un type de catégorie."""
+        links = self.event_issues
+        if category_type is not None:
+            links = links.filter(pc.equal(as_strings(links["category_type"]), category_type))
+
+        translated = pc.is_in(as_strings(links["issue_id"]), value_set=self._translated_ids)
+        links = links.append_column("translated", pc.cast(translated, pa.int64()))
+        result = aggregate_coverage(links, ["event_id", "period_id"])
+        return result.sort_by([("coverage", "ascending"), ("issues", "descending")])
+
+
+def print_table(title, table, limit):
+    """Affiche les premières lignes d'une table de résultats."""
+    print(f"\n📊 {title}")
+    for row in table.slice(0, limit).to_pylist():
+        print("  " + " | ".join(
+            f"{key}={value:.1%}" if key == "coverage" else f"{key}={value}"
+            for key, value in row.items()
+        ))
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Statistiques sur le catalogue exporté.")
+    parser.add_argument("--input", default="./export", help="Dossier de l'export")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="parquet", help="Format des fichiers")
+    parser.add_argument("--role", choices=CREATOR_ROLES, default="writers", help="Rôle des créateurs")
+    parser.add_argument("--limit", type=int, default=20, help="Nombre de lignes affichées")
+    args = parser.parse_args()
+
+    query = CatalogueQuery.load(args.input, args.format)
+
+    print_table("Couverture par période", query.coverage("period_id"), args.limit)
+    print_table(
+        f"{args.role} avec le plus d'issues non traduites par période",
+        query.creator_stats(args.role, by="period_id", untranslated_only=True),
+        args.limit,
+    )
+    print_table("Events les moins traduits", query.event_coverage(), args.limit)
+
+
+if __name__ == "__main__":
+    main()